@@ -0,0 +1,82 @@
+import hashlib
+import os
+import pickle
+import time
+
+# Directory where results are cached between runs of the tool
+cache_dir = os.path.join(os.path.expanduser('~'), '.cache', 'capgains')
+
+
+def make_key(*parts):
+    """Build a cache key out of the given parts"""
+    key_str = ":".join(str(part) for part in parts)
+    return hashlib.blake2b(key_str.encode()).hexdigest()
+
+
+def _group_prefix(group):
+    return make_key(group)[:16]
+
+
+def _cache_path(key, group=None):
+    if group is None:
+        name = key
+    else:
+        name = "{}-{}".format(_group_prefix(group), key)
+    return os.path.join(cache_dir, "{}.pkl".format(name))
+
+
+def load(key, group=None, max_age=None):
+    """Return the object cached under the key, or None if there is no usable
+    cache entry. If max_age is given, entries stored more than max_age
+    seconds ago are treated as missing."""
+    path = _cache_path(key, group)
+    try:
+        if (max_age is not None and
+                time.time() - os.path.getmtime(path) > max_age):
+            return None
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # A missing or corrupt cache entry is treated as a cache miss
+        return None
+
+
+def store(key, obj, group=None):
+    """Cache the object under the key. If a group is given, the entries
+    stored earlier in the same group are removed, so that only the latest
+    entry of each group is kept. Failing to write to the cache is not an
+    error since the cache is only an optimization."""
+    path = _cache_path(key, group)
+    tmp_path = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+        # Move the entry into place so readers never see a partial file
+        os.replace(tmp_path, path)
+    except Exception:
+        # Don't leave a partially written entry behind
+        _remove(tmp_path)
+        return
+    if group is not None:
+        _remove_group_entries(group, keep=path)
+
+
+def _remove_group_entries(group, keep):
+    """Remove the entries of the group, except for the one at path keep"""
+    prefix = "{}-".format(_group_prefix(group))
+    try:
+        names = os.listdir(cache_dir)
+    except OSError:
+        return
+    for name in names:
+        path = os.path.join(cache_dir, name)
+        if name.startswith(prefix) and name.endswith('.pkl') and path != keep:
+            _remove(path)
+
+
+def _remove(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
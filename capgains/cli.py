@@ -1,34 +1,61 @@
 import click
+import functools
 
-from capgains.commands.capgains_show import capgains_show
-from capgains.commands.capgains_calc import capgains_calc
 from capgains.transactions_reader import TransactionsReader
 
 
+def _tickers_filter(tickers):
+    """Turn the tickers passed on the command line into a set once, so that
+    filtering on them is a hash lookup per transaction"""
+    return frozenset(tickers) if tickers else None
+
+
 @click.group()
 def capgains():
     pass
 
 
-@capgains.command(help=("Show entries from the transactions CSV-file in a "
-                        "tabular format. Filters can be applied to narrow "
-                        "down the entries."))
-@click.argument('transactions-csv')
-@click.option('-t', '--tickers', metavar='TICKERS',
-              multiple=True, help="Stocks tickers to filter for")
-def show(transactions_csv, tickers):
-    transactions = TransactionsReader.get_transactions(transactions_csv)
+def _transactions_command(help, extra_params=()):
+    """Register a subcommand that reads the transactions CSV-file and can be
+    filtered by tickers. The decorated function is called with the parsed
+    transactions, the tickers filter and any extra parameters."""
+    def decorator(f):
+        @functools.wraps(f)
+        def command(transactions_csv, tickers, **kwargs):
+            transactions = TransactionsReader.get_transactions(
+                transactions_csv)
+            return f(transactions, tickers=_tickers_filter(tickers), **kwargs)
+        # click decorators are applied bottom-up, so apply them in reverse
+        # to get the CSV-file argument first and the tickers option last
+        command = click.option('-t', '--tickers', metavar='TICKERS',
+                               multiple=True,
+                               help="Stocks tickers to filter for")(command)
+        for param in reversed(extra_params):
+            command = param(command)
+        command = click.argument('transactions-csv')(command)
+        return capgains.command(help=help)(command)
+    return decorator
+
+
+@_transactions_command(
+    help=("Show entries from the transactions CSV-file in a tabular format. "
+          "Filters can be applied to narrow down the entries."))
+def show(transactions, tickers):
+    # Imported here so that each subcommand only pays the import cost of the
+    # modules it actually uses
+    from capgains.commands.capgains_show import capgains_show
+
     capgains_show(transactions, tickers)
 
 
-@capgains.command(help=("Calculates capital gains from the transactions "
-                        "CSV-file and displays output in a tabular format. "
-                        "Filters can be applied to select which stocks to "
-                        "calculate the capital gains on."))
-@click.argument('transactions-csv')
-@click.argument('year', type=click.INT)
-@click.option('-t', '--tickers', metavar='TICKERS',
-              multiple=True, help="Stocks tickers to filter for")
-def calc(transactions_csv, year, tickers):
-    transactions = TransactionsReader.get_transactions(transactions_csv)
+@_transactions_command(
+    help=("Calculates capital gains from the transactions CSV-file and "
+          "displays output in a tabular format. Filters can be applied to "
+          "select which stocks to calculate the capital gains on."),
+    extra_params=(click.argument('year', type=click.INT),))
+def calc(transactions, year, tickers):
+    # The calc command pulls in the exchange rate module (and requests), so
+    # defer the import until it is actually run
+    from capgains.commands.capgains_calc import capgains_calc
+
     capgains_calc(transactions, year, tickers=tickers)
@@ -1,6 +1,5 @@
 import click
 import tabulate
-from itertools import groupby
 
 from capgains.exchange_rate import ExchangeRate
 from capgains.ticker_gains import TickerGains
@@ -17,6 +16,18 @@ colalign = (
     "right",  # capital gain
 )
 
+# the table column headers, in the same order as colalign
+headers = (
+    "date",
+    "description",
+    "ticker",
+    "qty",
+    "proceeds",
+    "ACB",
+    "outlays",
+    "capital gain/loss",
+)
+
 
 def _get_total_gains(transactions):
     total = 0
@@ -26,30 +37,36 @@ def _get_total_gains(transactions):
 
 
 def _get_map_of_currencies_to_exchange_rates(transactions):
-    """First, split the list of transactions into sublists where each sublist
-    will only contain transactions with the same currency"""
-
-    contiguous_currencies = sorted(transactions.transactions,
-                                   key=lambda t: t.currency)
-    currency_groups = [list(g) for _, g in groupby(contiguous_currencies,
-                                                   lambda t: t.currency)]
-    currencies_to_exchange_rates = dict()
+    """Find the date range spanned by the transactions of each currency in a
+    single pass, and create an ExchangeRate object for each currency covering
+    that range"""
+    currency_date_ranges = dict()
+    for t in transactions.transactions:
+        date_range = currency_date_ranges.get(t.currency)
+        if date_range is None:
+            currency_date_ranges[t.currency] = [t.date, t.date]
+            continue
+        if t.date < date_range[0]:
+            date_range[0] = t.date
+        if t.date > date_range[1]:
+            date_range[1] = t.date
     # Create a separate ExchangeRate object for each currency
-    for currency_group in currency_groups:
-        currency = currency_group[0].currency
-        min_date = currency_group[0].date
-        max_date = currency_group[-1].date
-        currencies_to_exchange_rates[currency] = ExchangeRate(
-            currency, min_date, max_date)
-    return currencies_to_exchange_rates
+    return {currency: ExchangeRate(currency, min_date, max_date)
+            for currency, (min_date, max_date)
+            in currency_date_ranges.items()}
 
 
-def calculate_gains(transactions, year, ticker):
+def calculate_gains(transactions, year, ticker, exchange_rates=None):
+    """Calculate the capital gains of the ticker and return the sales made in
+    the year. The exchange rates map is built from the ticker's transactions
+    if it is not given."""
     ticker_transactions = transactions.filter_by(tickers=[ticker],
                                                  max_year=year)
-    er_map = _get_map_of_currencies_to_exchange_rates(ticker_transactions)
+    if exchange_rates is None:
+        exchange_rates = _get_map_of_currencies_to_exchange_rates(
+            ticker_transactions)
     tg = TickerGains(ticker)
-    tg.add_transactions(ticker_transactions, er_map)
+    tg.add_transactions(ticker_transactions, exchange_rates)
     return ticker_transactions.filter_by(year=year, action='SELL',
                                          superficial_loss=False)
 
@@ -61,17 +78,19 @@ def capgains_calc(transactions, year, tickers=None):
     if not filtered_transactions:
         click.echo("No transactions available")
         return
+    # Fetch the exchange rates once for all tickers rather than once per
+    # ticker, covering every transaction up to the end of the year
+    er_map = _get_map_of_currencies_to_exchange_rates(
+        filtered_transactions.filter_by(max_year=year))
     for ticker in filtered_transactions.tickers:
         click.echo("{}-{}".format(ticker, year))
         transactions_to_report = calculate_gains(filtered_transactions, year,
-                                                 ticker)
+                                                 ticker, er_map)
         if not transactions_to_report:
             click.echo("No capital gains\n")
             continue
         total_gains = _get_total_gains(transactions_to_report)
         click.echo("[Total Gains = {0:,.2f}]".format(total_gains))
-        headers = ["date", "description", "ticker", "qty", "proceeds", "ACB",
-                   "outlays", "capital gain/loss"]
         rows = [[
             t.date,
             t.description,
@@ -1,5 +1,4 @@
 import click
-import tabulate
 
 
 # describes how to align the individual table columns
@@ -14,6 +13,55 @@ colalign = (
     "right",  # currency
 )
 
+# the table column headers, in the same order as colalign
+headers = (
+    "date",
+    "description",
+    "ticker",
+    "action",
+    "qty",
+    "price",
+    "commission",
+    "currency",
+)
+
+
+def _is_plain_cell(cell):
+    """Whether the cell is plain printable ASCII, which is all that
+    _psql_table knows how to lay out"""
+    return cell.isascii() and cell.isprintable()
+
+
+def _psql_table(headers, rows, colalign):
+    """Lay out the rows the same way tabulate's "psql" table format does.
+    Returns None if any cell needs tabulate's handling of multi-line or
+    wide/invisible characters."""
+    rows = [[str(cell) for cell in row] for row in rows]
+    if not all(_is_plain_cell(cell) for row in rows for cell in row):
+        return None
+    # tabulate strips the cells and pads every column to at least 2
+    # characters wider than the header
+    rows = [[cell.strip() for cell in row] for row in rows]
+    widths = [len(header) + 2 for header in headers]
+    for row in rows:
+        for i, cell in enumerate(row):
+            if len(cell) > widths[i]:
+                widths[i] = len(cell)
+    justify = [str.ljust if align == "left" else str.rjust
+               for align in colalign]
+
+    def fmt_row(cells):
+        return "| {} |".format(" | ".join(
+            just(cell, width)
+            for just, cell, width in zip(justify, cells, widths)))
+
+    dashes = ["-" * (width + 2) for width in widths]
+    border = "+{}+".format("+".join(dashes))
+    lines = [border, fmt_row(headers), "|{}|".format("+".join(dashes))]
+    lines.extend(fmt_row(row) for row in rows)
+    lines.append(border)
+    return "\n".join(lines)
+
 
 def capgains_show(transactions, tickers=None):
     """Take a list of transactions and print them in tabular format."""
@@ -21,18 +69,24 @@ def capgains_show(transactions, tickers=None):
     if not filtered_transactions:
         click.echo("No results found")
         return
-    headers = ["date", "description", "ticker", "action", "qty", "price",
-               "commission", "currency"]
-    rows = [[
-        t.date,
-        t.description,
-        t.ticker,
-        t.action,
-        "{0:f}".format(t.qty.normalize()),
-        "{:,.2f}".format(t.price),
-        "{:,.2f}".format(t.commission),
-        t.currency
-    ] for t in filtered_transactions]
-    output = tabulate.tabulate(rows, headers=headers, colalign=colalign,
-                               tablefmt="psql", disable_numparse=True)
+    rows = []
+    rows_append = rows.append
+    for t in filtered_transactions:
+        rows_append([
+            t.date,
+            t.description,
+            t.ticker,
+            t.action,
+            f"{t.qty.normalize():f}",
+            f"{t.price:,.2f}",
+            f"{t.commission:,.2f}",
+            t.currency
+        ])
+    output = _psql_table(headers, rows, colalign)
+    if output is None:
+        # tabulate is slow to import and is only needed for cells that the
+        # fast path can't handle, so only import it when we fall back to it
+        import tabulate
+        output = tabulate.tabulate(rows, headers=headers, colalign=colalign,
+                                   tablefmt="psql", disable_numparse=True)
     click.echo(output)
@@ -1,8 +1,15 @@
 import requests
+from bisect import bisect_right
 from datetime import date, timedelta, datetime
 from decimal import Decimal
 from click import ClickException
 
+from capgains import cache
+
+_ONE = Decimal(1)
+# Rates fetched from the Bank of Canada are reused by later runs for a day
+_RATES_CACHE_MAX_AGE = timedelta(days=1).total_seconds()
+
 
 class ExchangeRate:
     indicative_rate_min_date = date(2017, 1, 3)
@@ -20,6 +27,7 @@ class ExchangeRate:
         self._start_date = start_date
         self._end_date = end_date
         self._rates = dict()
+        self._sorted_dates = []
 
         if currency_from not in self.supported_currencies:
             raise ClickException(
@@ -46,6 +54,7 @@ class ExchangeRate:
         indicative_rates = self._fetch_indicative_rates(start_date, end_date)
         self._rates.update(noon_rates)
         self._rates.update(indicative_rates)
+        self._sorted_dates = sorted(self._rates)
 
     def _fetch_rates(self, start_date, end_date, forex_str):
         """Fetch exchange rates from the supplied URL"""
@@ -57,6 +66,13 @@ class ExchangeRate:
         params = {"start_date": start_date.isoformat(),
                   "end_date": end_date.isoformat()}
         url = "{}/{}/json".format(self.valet_obs_url, forex_str)
+        cache_key = cache.make_key(url, params["start_date"],
+                                   params["end_date"])
+        # Only keep the latest range cached for each series
+        cached_rates = cache.load(cache_key, group=url,
+                                  max_age=_RATES_CACHE_MAX_AGE)
+        if cached_rates is not None:
+            return cached_rates
         response = None
         try:
             response = requests.get(url=url, params=params)
@@ -86,6 +102,13 @@ class ExchangeRate:
             date = datetime.strptime(date_str, '%Y-%m-%d').date()
             rate = Decimal(day_rate[forex_str][self.value])
             rates[date] = rate
+        # Only cache ranges whose rates have all been published, otherwise
+        # later runs would keep using an older rate for the most recent days.
+        # The rate for a day is published by the end of that day, and an
+        # extra day is allowed for time zones.
+        if (rates and
+                end_date < datetime.today().date() - timedelta(days=1)):
+            cache.store(cache_key, rates, group=url)
         return rates
 
     def _fetch_noon_rates(self, start_date, end_date):
@@ -118,10 +141,10 @@ class ExchangeRate:
         """
         if date in self._rates:
             return self._rates[date]
-        dates_preceeding = [d for d in self._rates if d < date]
-        if dates_preceeding:
-            closest_date = min(dates_preceeding, key=lambda d: (date - d))
-            return self._rates[closest_date]
+        # The closest preceeding date is the last one sorted before the date
+        i = bisect_right(self._sorted_dates, date)
+        if i:
+            return self._rates[self._sorted_dates[i - 1]]
         return None
 
     def get_rate(self, date):
@@ -131,7 +154,7 @@ class ExchangeRate:
             not exist for that day"""
         if self._currency_from == self.currency_to:
             # Converting CAD to CAD
-            rate = Decimal(1.00)
+            rate = _ONE
         else:
             # Converting Non-CAD to CAD
             rate = self._get_closest_rate_for_day(date)
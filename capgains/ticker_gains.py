@@ -1,6 +1,10 @@
+from bisect import bisect_left, bisect_right
 from click import ClickException
 from datetime import timedelta
 from decimal import Decimal
+from itertools import accumulate
+
+_ZERO = Decimal(0)
 
 
 class TickerGains:
@@ -10,60 +14,82 @@ class TickerGains:
         self._total_acb = 0
 
     def add_transactions(self, transactions, exchange_rates):
-        """Adds all transactions and updates the calculated values"""
-        for t in transactions:
-            rate = exchange_rates[t.currency].get_rate(t.date)
-            t.exchange_rate = rate
+        """Adds all transactions and updates the calculated values. The
+        transactions must be in chronological order."""
+        # The dates have to be sorted, so that the superficial loss window of
+        # each transaction can be found with a binary search
+        dates = [t.date for t in transactions]
+        if dates != sorted(dates):
+            raise ClickException(
+                "Transactions were not entered in chronological order")
+        self._add_rates(transactions, exchange_rates)
+        # Running totals (starting at 0 before the first transaction) of the
+        # share balance changes and of the number of purchases, so that the
+        # window checks are a subtraction instead of a walk over the window
+        balance_changes = list(accumulate(
+            (-t.qty if t.action == 'SELL' else t.qty for t in transactions),
+            initial=0))
+        purchase_counts = list(accumulate(
+            (t.action == 'BUY' for t in transactions), initial=0))
+        for idx, t in enumerate(transactions):
             self._add_transaction(t)
-            if self._is_superficial_loss(t, transactions):
+            if self._is_superficial_loss(idx, transactions, dates,
+                                         balance_changes, purchase_counts):
                 self._total_acb -= t.capital_gain
                 t.set_superficial_loss()
 
-    def _superficial_window_filter(self, transaction, min_date, max_date):
-        """Filter out BUY transactions that fall within
-        the 61 day superficial loss window"""
-        return transaction.date >= min_date and transaction.date <= max_date
+    def _add_rates(self, transactions, exchange_rates):
+        """Sets the exchange rate on all transactions, looking up the rate
+        only once for each currency and date"""
+        rates = dict()
+        for t in transactions:
+            key = (t.currency, t.date)
+            rate = rates.get(key)
+            if rate is None:
+                rate = exchange_rates[t.currency].get_rate(t.date)
+                rates[key] = rate
+            t.exchange_rate = rate
 
-    def _is_superficial_loss(self, transaction, transactions):
-        """Figures out if the transaction is a superficial loss"""
-        # Has to be a capital loss
-        if (transaction.capital_gain >= 0):
+    def _is_superficial_loss(self, idx, transactions, dates, balance_changes,
+                             purchase_counts):
+        """Figures out if the transaction at idx is a superficial loss"""
+        transaction = transactions[idx]
+        # Has to be a sale at a capital loss. Checking the action first skips
+        # the Decimal comparison for purchases, which never have a loss.
+        if (transaction.action != 'SELL' or transaction.capital_gain >= 0):
             return False
-        min_date = transaction.date - timedelta(days=30)
-        max_date = transaction.date + timedelta(days=30)
-        filtered_transactions = list(filter(
-            lambda t: self._superficial_window_filter(t, min_date, max_date),
-            transactions))
+        # Find the transactions in the 61 day superficial loss window
+        window_start = bisect_left(dates,
+                                   transaction.date - timedelta(days=30))
+        window_end = bisect_right(dates,
+                                  transaction.date + timedelta(days=30))
         # Has to have a purchase either 30 days before or 30 days after
-        if (not any(t.action == 'BUY' for t in filtered_transactions)):
+        if (purchase_counts[window_end] == purchase_counts[window_start]):
             return False
         # Has to have a positive share balance after 30 days
-        transaction_idx = filtered_transactions.index(transaction)
-        balance = transaction._share_balance
-        for window_transaction in filtered_transactions[transaction_idx+1:]:
-            if window_transaction.action == 'SELL':
-                balance -= window_transaction.qty
-            else:
-                balance += window_transaction.qty
+        balance = (transaction._share_balance +
+                   balance_changes[window_end] - balance_changes[idx + 1])
         return balance > 0
 
     def _add_transaction(self, transaction):
         """Adds a transaction and updates the calculated values."""
-        if self._share_balance == 0:
-            # to prevent divide by 0 error
-            old_acb_per_share = 0
-        else:
-            old_acb_per_share = self._total_acb / self._share_balance
-        proceeds = (transaction.qty * transaction.price) * transaction.exchange_rate  # noqa: E501
+        qty = transaction.qty
+        proceeds = (qty * transaction.price) * transaction.exchange_rate
         if transaction.action == 'SELL':
-            self._share_balance -= transaction.qty
-            acb = old_acb_per_share * transaction.qty
+            # Only sales need the ACB per share before the transaction
+            if self._share_balance == 0:
+                # to prevent divide by 0 error
+                old_acb_per_share = 0
+            else:
+                old_acb_per_share = self._total_acb / self._share_balance
+            self._share_balance -= qty
+            acb = old_acb_per_share * qty
             capital_gain = proceeds - transaction.expenses - acb
             self._total_acb -= acb
         else:
-            self._share_balance += transaction.qty
+            self._share_balance += qty
             acb = proceeds + transaction.expenses
-            capital_gain = Decimal(0.0)
+            capital_gain = _ZERO
             self._total_acb += acb
         if self._share_balance < 0:
             raise ClickException("Transaction caused negative share balance")
@@ -1,9 +1,31 @@
 from decimal import Decimal
 
+# Decimal objects are immutable, so every transaction can share the same zero
+_ZERO = Decimal(0)
+
 
 class Transaction:
     """Represents a transaction entry from the CSV-file"""
 
+    # Transactions are created for every entry in the CSV-file, so avoid
+    # giving each of them a __dict__
+    __slots__ = (
+        '_date',
+        '_description',
+        '_ticker',
+        '_action',
+        '_qty',
+        '_price',
+        '_commission',
+        '_currency',
+        '_exchange_rate',
+        '_share_balance',
+        '_proceeds',
+        '_capital_gain',
+        '_acb',
+        '_superficial_loss',
+    )
+
     def __init__(self, date, description, ticker, action, qty, price,
                  commission, currency):
         self._date = date
@@ -15,10 +37,10 @@ class Transaction:
         self._commission = Decimal(commission)
         self._currency = currency
         self._exchange_rate = None
-        self._share_balance = Decimal(0.0)
-        self._proceeds = Decimal(0.0)
-        self._capital_gain = Decimal(0.0)
-        self._acb = Decimal(0.0)
+        self._share_balance = _ZERO
+        self._proceeds = _ZERO
+        self._capital_gain = _ZERO
+        self._acb = _ZERO
         self._superficial_loss = False
 
     @property
@@ -101,7 +123,7 @@ class Transaction:
 
     @superficial_loss.setter
     def superficial_loss(self, superficial_loss):
-        self._superficial_loss = Decimal(superficial_loss)
+        self._superficial_loss = bool(superficial_loss)
 
     @property
     def expenses(self):
@@ -109,4 +131,4 @@ class Transaction:
 
     def set_superficial_loss(self):
         self.superficial_loss = True
-        self.capital_gain = Decimal(0.0)
+        self.capital_gain = _ZERO
@@ -1,11 +1,17 @@
+from collections import defaultdict
+from itertools import chain
+
+
 class Transactions:
     """Holds a collection of transactions"""
 
     def __init__(self, transactions):
-        self._transactions = list()
-        self._tickers = dict()
-        for transaction in transactions:
-            self.add_transaction(transaction)
+        self._transactions = list(transactions)
+        # Maps each ticker to the positions of its transactions, so that
+        # filtering on tickers only has to visit the matching transactions
+        self._tickers = defaultdict(list)
+        for i, transaction in enumerate(self._transactions):
+            self._tickers[transaction.ticker].append(i)
 
     @property
     def transactions(self):
@@ -28,31 +34,42 @@ class Transactions:
 
     def add_transaction(self, transaction):
         """Add a transaction to the list of stored transactions."""
+        self._tickers[transaction.ticker].append(len(self.transactions))
         self.transactions.append(transaction)
 
-        ticker_refcount = self._tickers.get(transaction.ticker, 0)
-        ticker_refcount += 1
-        self._tickers[transaction.ticker] = ticker_refcount
-
     def filter_by(self, tickers=None, year=None, max_year=None, action=None,
                   superficial_loss=None):
         """Filter the list of stored transactions on certain parameters (such
         as ticker, year, etc) and return only the transactions that match the
-        requested parameters.
+        requested parameters. If no parameters are given, nothing would be
+        filtered out, so this collection itself is returned.
         """
-        def lambda_filter(t):
-            keep = True
-            if tickers:
-                keep &= (t.ticker in tickers)
-            if year:
-                keep &= (t.date.year == year)
-            if max_year:
-                keep &= (t.date.year <= max_year)
-            if action:
-                keep &= (t.action == action)
-            if superficial_loss is not None:
-                # superficial_loss can be set to False, so need to explicitly
-                # check that it is not set to None
-                keep &= (t.superficial_loss == superficial_loss)
-            return keep
-        return Transactions(filter(lambda_filter, self.transactions))
+        if not (tickers or year or max_year or action or
+                superficial_loss is not None):
+            return self
+        if tickers:
+            # Only visit the transactions of the requested tickers, in the
+            # order they were added
+            positions = sorted(chain.from_iterable(
+                self._tickers.get(ticker, ()) for ticker in set(tickers)))
+            transactions = [self.transactions[i] for i in positions]
+        else:
+            transactions = self.transactions
+
+        # Only check the requested parameters, and stop checking a
+        # transaction after the first check it fails
+        predicates = list()
+        if year:
+            predicates.append(lambda t: t.date.year == year)
+        if max_year:
+            predicates.append(lambda t: t.date.year <= max_year)
+        if action:
+            predicates.append(lambda t: t.action == action)
+        if superficial_loss is not None:
+            # superficial_loss can be set to False, so need to explicitly
+            # check that it is not set to None
+            predicates.append(
+                lambda t: t.superficial_loss == superficial_loss)
+        for predicate in predicates:
+            transactions = filter(predicate, transactions)
+        return Transactions(transactions)
@@ -1,12 +1,22 @@
 import csv
+import functools
+import os
 from click import ClickException
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
+from . import __version__, cache
 from .transaction import Transaction
 from .transactions import Transactions
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date(date_str):
+    """Parse a YYYY-MM-DD date. strptime is slow and the same dates tend to be
+    repeated throughout a CSV-file, so memoize the results."""
+    return datetime.strptime(date_str, '%Y-%m-%d').date()
+
+
 class TransactionsReader:
     """An interface that converts a CSV-file with transaction entries into a
     list of Transactions.
@@ -25,14 +35,38 @@ class TransactionsReader:
     @classmethod
     def get_transactions(cls, csv_file):
         """Convert the CSV-file entries into a list of Transactions."""
-        transactions = []
+        try:
+            stat = os.stat(csv_file)
+        except OSError:
+            # Let the parser report the problem with the file
+            entries = cls._read_entries(csv_file)
+        else:
+            entries = _read_entries_cached(csv_file,
+                                           os.path.abspath(csv_file),
+                                           stat.st_mtime_ns,
+                                           stat.st_size)
+        # Build new Transaction objects every time since they get modified
+        # when calculating capital gains
+        return Transactions(Transaction(*entry) for entry in entries)
+
+    @classmethod
+    def _read_entries(cls, csv_file):
+        """Parse the CSV-file entries into a tuple of parsed column values for
+        each entry."""
+        entries = []
+        # The column positions are the same for every entry, so look them up
+        # once rather than for every entry
+        expected_num_columns = len(cls.columns)
+        date_idx = cls.columns.index("date")
+        qty_idx = cls.columns.index("qty")
+        price_idx = cls.columns.index("price")
+        commission_idx = cls.columns.index("commission")
         try:
             with open(csv_file, newline='') as f:
                 reader = csv.reader(f)
                 last_date = None
                 for entry_no, entry in enumerate(reader):
                     actual_num_columns = len(entry)
-                    expected_num_columns = len(cls.columns)
                     if actual_num_columns != expected_num_columns:
                         # Each line in the CSV file should have the same number
                         # of columns as we expect
@@ -41,17 +75,13 @@ class TransactionsReader:
                             .format(entry_no,
                                     expected_num_columns,
                                     actual_num_columns))
-                    date_idx = cls.columns.index("date")
                     date_str = entry[date_idx]
                     try:
-                        entry[date_idx] = datetime.strptime(
-                            date_str.split(" ")[0],
-                            '%Y-%m-%d').date()
+                        entry[date_idx] = _parse_date(date_str.split(" ")[0])
                     except ValueError:
                         raise ClickException(
                             "The date ({}) was not entered in the correct format (YYYY-MM-DD)"  # noqa: E501
                             .format(date_str))
-                    qty_idx = cls.columns.index("qty")
                     qty_str = entry[qty_idx]
                     try:
                         entry[qty_idx] = Decimal(qty_str)
@@ -59,7 +89,6 @@ class TransactionsReader:
                         raise ClickException(
                             "The quantity entered {} is not a valid number"
                             .format(qty_str))
-                    price_idx = cls.columns.index("price")
                     price_str = entry[price_idx]
                     try:
                         entry[price_idx] = Decimal(price_str)
@@ -67,7 +96,6 @@ class TransactionsReader:
                         raise ClickException(
                             "The price entered {} is not a valid number"
                             .format(price_str))
-                    commission_idx = cls.columns.index("commission")
                     commission_str = entry[commission_idx]
                     try:
                         entry[commission_idx] = Decimal(commission_str)
@@ -75,15 +103,33 @@ class TransactionsReader:
                         raise ClickException(
                             "The commission entered {} is not a valid number"
                             .format(commission_str))
-                    transaction = Transaction(*entry)
+                    entry_date = entry[date_idx]
                     if last_date:
-                        if transaction.date < last_date:
+                        if entry_date < last_date:
                             raise ClickException(
                                 "Transactions were not entered in chronological order")  # noqa: E501
-                    last_date = transaction.date
-                    transactions.append(transaction)
-            return Transactions(transactions)
+                    last_date = entry_date
+                    entries.append(tuple(entry))
+            return tuple(entries)
         except FileNotFoundError:
             raise ClickException("File not found: {}".format(csv_file))
         except OSError:
             raise OSError("Could not open {} for reading".format(csv_file))
+
+
+@functools.lru_cache(maxsize=8)
+def _read_entries_cached(csv_file, abs_path, mtime_ns, size):
+    """Memoize the parsed entries of a CSV-file for as long as its
+    modification time and size stay the same. The entries are also cached on
+    disk so that later runs don't have to parse the file again. Only the
+    entries are cached, which are plain values, so changes to the Transaction
+    classes never invalidate the cache."""
+    key = cache.make_key(__version__, abs_path, mtime_ns, size,
+                         *TransactionsReader.columns)
+    # Group the entries by file, so that the entries cached for an older
+    # version of the file are removed
+    entries = cache.load(key, group=abs_path)
+    if entries is None:
+        entries = TransactionsReader._read_entries(csv_file)
+        cache.store(key, entries, group=abs_path)
+    return entries
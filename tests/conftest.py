@@ -2,6 +2,7 @@ import pytest
 import requests_mock as rm
 from datetime import date
 
+from capgains import cache, transactions_reader
 from capgains.transaction import Transaction
 from capgains.transactions import Transactions
 
@@ -11,6 +12,21 @@ def testfiles_dir(tmpdir_factory):
     return tmpdir_factory.mktemp("testfiles")
 
 
+@pytest.fixture(scope='function', autouse=True)
+def cache_dir(tmpdir, monkeypatch):
+    """Keep the on-disk cache out of the user's home directory, and make sure
+    that tests don't share cache entries with each other"""
+    path = tmpdir.mkdir("cache")
+    monkeypatch.setattr(cache, 'cache_dir', str(path))
+    return path
+
+
+@pytest.fixture(scope='function', autouse=True)
+def clear_transactions_reader_cache():
+    """Don't let parsed CSV-files leak between tests"""
+    transactions_reader._read_entries_cached.cache_clear()
+
+
 @pytest.fixture(scope='function')
 def transactions():
     trans = [
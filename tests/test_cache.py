@@ -0,0 +1,70 @@
+import os
+import time
+
+from capgains import cache
+
+
+def test_load_missing_key():
+    """Testing that an uncached key is a cache miss"""
+    assert cache.load(cache.make_key('missing')) is None
+
+
+def test_store_and_load():
+    """Testing that a stored object can be loaded back"""
+    key = cache.make_key('some', 'parts', 1)
+    cache.store(key, {'a': [1, 2, 3]})
+    assert cache.load(key) == {'a': [1, 2, 3]}
+
+
+def test_load_expired_entry(cache_dir):
+    """Testing that an entry older than max_age is treated as a cache miss"""
+    key = cache.make_key('expiring')
+    cache.store(key, 'value')
+    assert cache.load(key, max_age=60) == 'value'
+    an_hour_ago = time.time() - 3600
+    os.utime(cache_dir.join("{}.pkl".format(key)), (an_hour_ago, an_hour_ago))
+    assert cache.load(key, max_age=60) is None
+    assert cache.load(key) == 'value'
+
+
+def test_make_key_depends_on_parts():
+    """Testing that different parts produce different keys"""
+    assert cache.make_key('a', 1) == cache.make_key('a', 1)
+    assert cache.make_key('a', 1) != cache.make_key('a', 2)
+
+
+def test_load_corrupt_entry(cache_dir):
+    """Testing that a corrupt cache entry is treated as a cache miss"""
+    key = cache.make_key('corrupt')
+    cache_dir.join("{}.pkl".format(key)).write_binary(b'not a pickle')
+    assert cache.load(key) is None
+
+
+def test_store_unwritable_dir(cache_dir, monkeypatch):
+    """Testing that failing to write to the cache is not an error"""
+    blocker = cache_dir.join("blocker")
+    blocker.write("")
+    monkeypatch.setattr(cache, 'cache_dir', str(blocker.join("sub")))
+    key = cache.make_key('unwritable')
+    cache.store(key, 'value')
+    assert cache.load(key) is None
+
+
+def test_store_replaces_group_entries(cache_dir):
+    """Testing that storing an entry removes the older entries of its group,
+    but not the entries of other groups"""
+    cache.store(cache.make_key('old'), 'old', group='group')
+    cache.store(cache.make_key('other'), 'other', group='other group')
+    cache.store(cache.make_key('new'), 'new', group='group')
+    assert cache.load(cache.make_key('old'), group='group') is None
+    assert cache.load(cache.make_key('new'), group='group') == 'new'
+    assert cache.load(cache.make_key('other'), group='other group') == 'other'
+    assert len(cache_dir.listdir()) == 2
+
+
+def test_store_unpicklable_object(cache_dir):
+    """Testing that failing to pickle an object leaves no file behind"""
+    key = cache.make_key('unpicklable')
+    cache.store(key, lambda: None)
+    assert cache.load(key) is None
+    assert cache_dir.listdir() == []
@@ -1,15 +1,23 @@
+import os
+import subprocess
+import sys
 from click.testing import CliRunner
+from capgains import transactions_reader
 from capgains.cli import capgains
+from capgains.transactions_reader import TransactionsReader
 
 from tests.helpers import create_csv_file, transactions_to_list
 
+# Every invocation runs in its own isolated environment, so the tests can
+# share a single runner
+runner = CliRunner()
+
 
 def test_show_file_not_found(testfiles_dir):
     """Testing the capgains show command with a file that doesn't exist"""
     filepath = create_csv_file(testfiles_dir,
                                "showdnetest.csv")
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['show', filepath])
 
     assert result.exit_code == 1
@@ -25,7 +33,6 @@ def test_show_no_ticker_arg(testfiles_dir, transactions):
                                transactions_to_list(transactions),
                                True)
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['show', filepath])
 
     assert result.exit_code == 0
@@ -48,7 +55,6 @@ def test_show_ticker_arg(testfiles_dir, transactions):
                                transactions_to_list(transactions),
                                True)
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['show', filepath, '-t', 'ANET'])
 
     assert result.exit_code == 0
@@ -70,7 +76,6 @@ def test_calc_no_ticker_arg(testfiles_dir, transactions, exchange_rates_mock):
                                transactions_to_list(transactions),
                                True)
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['calc', filepath, '2018'])
 
     assert result.exit_code == 0
@@ -96,7 +101,6 @@ def test_calc_ticker_arg(testfiles_dir, transactions, exchange_rates_mock):
                                transactions_to_list(transactions),
                                True)
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['calc', filepath, '2018', '-t', 'ANET'])
 
     assert result.exit_code == 0
@@ -119,10 +123,51 @@ def test_calc_no_year(testfiles_dir, transactions):
                                transactions_to_list(transactions),
                                True)
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['calc', filepath, '-t', 'ANET'])
     assert result.exit_code == 2
 
-    runner = CliRunner()
     result = runner.invoke(capgains, ['calc', filepath])
     assert result.exit_code == 2
+
+
+def test_show_uses_cached_transactions(testfiles_dir, transactions,
+                                       monkeypatch):
+    """Testing that the capgains show command reuses the transactions parsed
+    by a previous run when the CSV-file has not changed"""
+    filepath = create_csv_file(testfiles_dir,
+                               "showcachetest.csv",
+                               transactions_to_list(transactions),
+                               True)
+
+    first = runner.invoke(capgains, ['show', filepath])
+    assert first.exit_code == 0
+
+    # Forget the entries memoized in this process, the way a new run would
+    transactions_reader._read_entries_cached.cache_clear()
+
+    def fail(csv_file):
+        raise AssertionError("CSV-file should not be parsed again")
+    monkeypatch.setattr(TransactionsReader, '_read_entries', fail)
+    second = runner.invoke(capgains, ['show', filepath])
+    assert second.exit_code == 0
+    assert second.output == first.output
+
+
+def test_show_does_not_import_exchange_rate(testfiles_dir, transactions):
+    """Testing that the capgains show command never loads the exchange rate
+    module, since it only needs the transactions themselves"""
+    filepath = create_csv_file(testfiles_dir,
+                               "showimporttest.csv",
+                               transactions_to_list(transactions),
+                               True)
+    code = (
+        "import sys\n"
+        "from capgains.cli import capgains\n"
+        "capgains(['show', sys.argv[1]], standalone_mode=False)\n"
+        "assert 'capgains.exchange_rate' not in sys.modules\n"
+        "assert 'requests' not in sys.modules\n"
+    )
+    env = dict(os.environ, HOME=str(testfiles_dir))
+    result = subprocess.run([sys.executable, "-c", code, filepath], env=env,
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    assert result.returncode == 0, result.stderr.decode()
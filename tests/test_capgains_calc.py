@@ -41,6 +41,15 @@ ANET-2018
 """  # noqa: E501
 
 
+def test_exchange_rates_fetched_once(transactions, capfd,
+                                     exchange_rates_mock, requests_mock):
+    """Testing that capgains_calc fetches the exchange rates once instead of
+    once per ticker"""
+    CapGainsCalc.capgains_calc(transactions, 2018)
+    assert len(transactions.tickers) == 2
+    assert requests_mock.call_count == 1
+
+
 def test_no_transactions(capfd):
     """Testing capgains_calc without any transactions"""
     CapGainsCalc.capgains_calc(Transactions([]), 2018)
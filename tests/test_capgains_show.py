@@ -124,3 +124,28 @@ def test_partial_shares(capfd, requests_mock):
 | 2018-02-20 | RSU VEST      | ANET     | SELL     |   0.5 |  100.00 |         0.00 |        CAD |
 +------------+---------------+----------+----------+-------+---------+--------------+------------+
 """  # noqa: E501
+
+
+def test_non_ascii_description(capfd):
+    """Testing capgains_show with a description that isn't plain ASCII"""
+    transactions = Transactions([
+        Transaction(
+            date(2017, 2, 15),
+            'ACHAT RÉGIMÉ',
+            'ANET',
+            'BUY',
+            1,
+            50.00,
+            0.00,
+            'CAD')
+    ])
+
+    CapGainsShow.capgains_show(transactions)
+    out, _ = capfd.readouterr()
+    assert out == """\
++------------+---------------+----------+----------+-------+---------+--------------+------------+
+| date       | description   | ticker   | action   |   qty |   price |   commission |   currency |
+|------------+---------------+----------+----------+-------+---------+--------------+------------|
+| 2017-02-15 | ACHAT RÉGIMÉ  | ANET     | BUY      |     1 |   50.00 |         0.00 |        CAD |
++------------+---------------+----------+----------+-------+---------+--------------+------------+
+"""  # noqa: E501
@@ -119,6 +119,14 @@ def test_exchange_rate_noon_and_indicative(USD_exchange_rates_mock):
     assert er.get_rate(indicative_rate_date) == Decimal('1.3')
 
 
+def test_exchange_rate_between_noon_and_indicative(USD_exchange_rates_mock):
+    # no rates between the two, expect the last noon rate
+    noon_rate_date = date(2016, 5, 21)
+    indicative_rate_date = date(2020, 5, 22)
+    er = ExchangeRate('USD', noon_rate_date, indicative_rate_date)
+    assert er.get_rate(date(2018, 1, 1)) == Decimal('1.1')
+
+
 def test_cad_to_cad_rate_is_1():
     day = date(2020, 5, 22)
     er = ExchangeRate('CAD', day, day)
@@ -175,3 +183,43 @@ def test_get_rate_before_min_date_exception(USD_exchange_rates_mock):
     with pytest.raises(ClickException) as excinfo:
         er.get_rate(date(2017, 1, 2))
     assert excinfo.value.message == "Unable to find exchange rate on 2017-01-02"  # noqa: E501
+
+
+def test_rates_fetched_once_per_date_range(USD_exchange_rates_mock,
+                                           requests_mock):
+    """Testing that the rates fetched for a date range are cached on disk and
+    reused instead of being fetched again"""
+    day = date(2020, 5, 22)
+    ExchangeRate('USD', day, day)
+    er = ExchangeRate('USD', day, day)
+    assert requests_mock.call_count == 1
+    assert er.get_rate(day) == Decimal('1.3')
+
+
+def test_no_rates_not_cached(requests_mock):
+    """Testing that a fetch without any observations is not cached"""
+    requests_mock.get(rm.ANY, json={"observations": []})
+    day = date(2020, 5, 22)
+    ExchangeRate('USD', day, day)
+    ExchangeRate('USD', day, day)
+    assert requests_mock.call_count == 2
+
+
+def test_recent_rates_not_cached(requests_mock):
+    """Testing that the rates are not cached when the rates of the last days
+    in the range may not have been published yet"""
+    today = datetime.today().date()
+    requests_mock.get(rm.ANY, json={
+        "observations": [
+            {
+                "d": (today - timedelta(days=3)).isoformat(),
+                "FXUSDCAD": {
+                    "v": "1.2"
+                }
+            },
+        ]
+    })
+    ExchangeRate('USD', today, today)
+    er = ExchangeRate('USD', today, today)
+    assert requests_mock.call_count == 2
+    assert er.get_rate(today) == Decimal('1.2')
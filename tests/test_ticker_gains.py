@@ -183,6 +183,26 @@ def test_loss_no_purchase_in_window(exchange_rates_mock):
     assert transactions[1].capital_gain < 0
 
 
+def test_superficial_loss_window_includes_last_day(exchange_rates_mock):
+    """Testing if transaction is marked as a superficial loss when the only
+    purchase in the window is made exactly 30 days after the loss"""
+    transactions = [
+        Transaction(date(2018, 1, 1), 'ESPP PURCHASE', 'ANET', 'BUY',
+                    100, 100.00, 10.00, 'USD'),
+        Transaction(date(2018, 3, 1), 'RSU VEST', 'ANET', 'SELL',
+                    99, 50.00, 10.00, 'USD'),
+        Transaction(date(2018, 3, 31), 'RSU VEST', 'ANET', 'BUY',
+                    1, 50.00, 10.00, 'USD')
+    ]
+    tg = TickerGains(transactions[0].ticker)
+    er = ExchangeRate('USD', transactions[0].date,
+                      transactions[2].date)
+    er_map = {'USD': er}
+    tg.add_transactions(transactions, er_map)
+    assert transactions[1].superficial_loss
+    assert transactions[1].capital_gain == 0
+
+
 def test_gain_not_marked_as_superficial_loss(exchange_rates_mock):
     """Testing if transaction is not marked as a superficial loss if
     it does not result in a loss"""
@@ -230,6 +250,17 @@ def test_ticker_gains_negative_balance(transactions, exchange_rates_mock):
     assert excinfo.value.message == "Transaction caused negative share balance"
 
 
+def test_ticker_gains_not_chronological(transactions, exchange_rates_mock):
+    """Transactions that are not in chronological order are rejected, since
+    the superficial loss window can't be found otherwise"""
+    tg = TickerGains(transactions[0].ticker)
+    er = ExchangeRate('USD', transactions[0].date, transactions[3].date)
+    er_map = {'USD': er}
+    with pytest.raises(ClickException) as excinfo:
+        tg.add_transactions([transactions[2], transactions[0]], er_map)
+    assert excinfo.value.message == "Transactions were not entered in chronological order"  # noqa: E501
+
+
 def test_ticker_gains_ok(transactions, exchange_rates_mock):
     tg = TickerGains(transactions[0].ticker)
     er = ExchangeRate('USD', transactions[0].date, transactions[3].date)
@@ -266,3 +297,29 @@ def test_ticker_gains_ok(transactions, exchange_rates_mock):
     assert transactions[3].acb == 13020.00
     assert transactions[3].superficial_loss is False
     assert transactions[3].expenses == 20.0
+
+
+def test_exchange_rate_looked_up_once_per_date():
+    """Testing that the exchange rate is only looked up once for transactions
+    sharing the same currency and date"""
+    class CountingExchangeRate:
+        def __init__(self):
+            self.lookups = []
+
+        def get_rate(self, day):
+            self.lookups.append(day)
+            return 2
+
+    transactions = [
+        Transaction(date(2018, 1, 1), 'ESPP PURCHASE', 'ANET', 'BUY',
+                    100, 100.00, 10.00, 'USD'),
+        Transaction(date(2018, 1, 1), 'RSU VEST', 'ANET', 'BUY',
+                    10, 100.00, 10.00, 'USD'),
+        Transaction(date(2018, 8, 1), 'RSU VEST', 'ANET', 'SELL',
+                    50, 150.00, 10.00, 'USD')
+    ]
+    er = CountingExchangeRate()
+    tg = TickerGains(transactions[0].ticker)
+    tg.add_transactions(transactions, {'USD': er})
+    assert er.lookups == [date(2018, 1, 1), date(2018, 8, 1)]
+    assert all(t.exchange_rate == 2 for t in transactions)
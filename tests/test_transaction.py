@@ -1,3 +1,4 @@
+import pickle
 import pytest
 
 
@@ -5,3 +6,17 @@ def test_cannot_set_negative_share_balance(transactions):
     with pytest.raises(ValueError) as excinfo:
         transactions[0].share_balance = -1
     assert str(excinfo.value) == "Share balance cannot be negative"
+
+
+def test_transaction_pickle_roundtrip(transactions):
+    """Transactions have no __dict__, make sure they can still be pickled"""
+    transaction = pickle.loads(pickle.dumps(transactions[0]))
+    assert transaction.date == transactions[0].date
+    assert transaction.qty == transactions[0].qty
+    assert transaction.currency == transactions[0].currency
+
+
+def test_superficial_loss_is_bool(transactions):
+    transactions[0].set_superficial_loss()
+    assert transactions[0].superficial_loss is True
+    assert transactions[0].capital_gain == 0
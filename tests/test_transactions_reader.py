@@ -26,7 +26,9 @@ def test_transactions_reader_default(testfiles_dir, transactions):
     actual_transactions = TransactionsReader.get_transactions(filepath)
     assert len(actual_transactions) == 1
     actual_transaction = actual_transactions[0]
-    assert actual_transaction.__dict__ == exp_transaction.__dict__
+    for attr in Transaction.__slots__:
+        assert getattr(actual_transaction, attr) == getattr(exp_transaction,
+                                                            attr)
 
 
 def test_transactions_reader_columns_error(testfiles_dir):
@@ -184,3 +186,36 @@ def test_transactions_commission_not_number(testfiles_dir):
     with pytest.raises(ClickException) as excinfo:
         TransactionsReader.get_transactions(filepath)
     assert excinfo.value.message == "The commission entered BLAH is not a valid number"  # noqa: E501
+
+
+def test_transactions_reader_memoized(testfiles_dir, transactions,
+                                      monkeypatch):
+    """Testing that TransactionsReader only parses an unchanged file once, but
+    still hands out new Transaction objects every time"""
+    filepath = create_csv_file(testfiles_dir,
+                               "memoized.csv",
+                               transactions_to_list(transactions),
+                               True)
+    first = TransactionsReader.get_transactions(filepath)
+
+    def fail(csv_file):
+        raise AssertionError("CSV-file should not be parsed again")
+    monkeypatch.setattr(TransactionsReader, '_read_entries', fail)
+    second = TransactionsReader.get_transactions(filepath)
+    assert transactions_to_list(second) == transactions_to_list(first)
+    assert all(a is not b for a, b in zip(first, second))
+
+
+def test_transactions_reader_memoized_file_changed(testfiles_dir,
+                                                   transactions):
+    """Testing that TransactionsReader parses a file again once it changes"""
+    filepath = create_csv_file(testfiles_dir,
+                               "memoizedchanged.csv",
+                               transactions_to_list(transactions),
+                               True)
+    assert len(TransactionsReader.get_transactions(filepath)) == 4
+    filepath = create_csv_file(testfiles_dir,
+                               "memoizedchanged.csv",
+                               transactions_to_list(transactions)[:1],
+                               True)
+    assert len(TransactionsReader.get_transactions(filepath)) == 1